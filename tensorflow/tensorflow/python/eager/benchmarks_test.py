@@ -105,9 +105,9 @@ def benchmark_matmul(shape, n, use_gpu=False):
            m.dtype.as_datatype_enum)
   with timer(label("TFE_Py_Execute"), iters=n) as iters:
     for _ in iters:
-      pywrap_tensorflow.TFE_DeleteTensorHandle(
-          pywrap_tensorflow.TFE_Py_Execute(ctx_handle, None, "MatMul",
-                                           input_handles, attrs, 1)[0])
+      # The returned Tensor owns (and deletes) its output handle.
+      pywrap_tensorflow.TFE_Py_Execute(ctx_handle, None, "MatMul",
+                                       input_handles, attrs, 1)
 
   f = function.defun(math_ops.matmul)
   with timer(label("defun(tf.matmul)"), iters=n) as iters:
@@ -426,6 +426,35 @@ class TFETest(test_util.TensorFlowTestCase):
           inputs=[tensor.Tensor(3)],
           attrs=('T', dtypes.int32.as_datatype_enum, 'unknown_attr', 'blah'))
 
+  def testMakeTypeAndShape(self):
+    self.assertEqual(dtypes.float32.as_datatype_enum,
+                     execute.make_type(dtypes.float32_ref, 'T'))
+    self.assertEqual(dtypes.float32.as_datatype_enum,
+                     execute.make_type('float32', 'T'))
+    with self.assertRaises(TypeError):
+      execute.make_type('not_a_type', 'T')
+    shape = [1, 2]
+    self.assertEqual([1, 2], execute.make_shape(shape, 'shape'))
+    self.assertIsNot(shape, execute.make_shape(shape, 'shape'))
+    self.assertEqual([None, 2], execute.make_shape([None, 2], 'shape'))
+    with self.assertRaises(ValueError):
+      execute.make_shape([-2], 'shape')
+
+  def testArgsToMixedEagerTensors(self):
+    types, lists = execute.args_to_mixed_eager_tensors(
+        [[1, 2.0], [tensor.Tensor(3.0), 4.0], [5, 6.0]])
+    self.assertEqual([dtypes.float32, dtypes.float32], types)
+    self.assertEqual(3, len(lists))
+    for l in lists:
+      self.assertEqual(types, [t.dtype for t in l])
+
+    types, lists = execute.args_to_mixed_eager_tensors([[1], [2]])
+    self.assertEqual([dtypes.int32], types)
+    self.assertAllEqual([1, 2], [l[0].numpy() for l in lists])
+
+    with self.assertRaises(ValueError):
+      execute.args_to_mixed_eager_tensors([[1, 2], [3]])
+
   def testComposition(self):
 
     def add(x, y):
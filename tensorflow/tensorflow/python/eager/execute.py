@@ -33,6 +33,21 @@ from tensorflow.python.framework import ops as ops
 from tensorflow.python.framework import tensor_shape
 from tensorflow.python.util import compat
 
+# Module-level aliases used by the per-input type checks below, which run for
+# every input of every eager op. `tensor.Tensor` has no subclasses, so an exact
+# type comparison is equivalent to (and cheaper than) `isinstance`.
+_Tensor = tensor.Tensor
+_getval = ag_core.getval
+
+# Op names converted to the bytes passed to TFE_Py_Execute. Names of functions
+# generated by `function.defun` ("__inference_*", "__forward_*", ...) are unique
+# per traced function, so they are not cached to keep this bounded.
+_OP_NAME_CACHE = {}
+
+# Have TFE_Py_Execute return eager Tensors rather than raw handles.
+pywrap_tensorflow.TFE_Py_RegisterTensorFromHandleFunction(
+    tensor._tensor_from_handle)  # pylint: disable=protected-access
+
 
 def execute(op_name, num_outputs, inputs, attrs=None, name=None):
   """Execute a TensorFlow operation.
@@ -57,29 +72,36 @@ def execute(op_name, num_outputs, inputs, attrs=None, name=None):
     An exception on error.
   """
   ctx = context.get_default_context()
-  # TODO(apassos) move this to convert_to_tensor
-  inputs = [ag_core.getval(x) for x in inputs]
-  # pylint: disable=protected-access
-  input_handles = [c._handle for c in inputs]
   device_name = ctx.device_name
+  op_name_bytes = _OP_NAME_CACHE.get(op_name)
+  if op_name_bytes is None:
+    op_name_bytes = compat.as_bytes(op_name)
+    if not op_name_bytes.startswith(b"__"):
+      _OP_NAME_CACHE[op_name] = op_name_bytes
+  # pylint: disable=protected-access
   try:
-    outh = pywrap_tensorflow.TFE_Py_Execute(ctx._handle, device_name,
-                                            str(op_name), input_handles, attrs,
-                                            num_outputs)
+    # TFE_Py_Execute unwraps autograd nodes and extracts the Tensor handles
+    # of `inputs` itself, and wraps its outputs in Tensors using the function
+    # registered above.
+    tensors = pywrap_tensorflow.TFE_Py_Execute(ctx._handle, device_name,
+                                               op_name_bytes, inputs, attrs,
+                                               num_outputs)
     # pylint: enable=protected-access
   except core._NotOkStatusException as e:  # pylint: disable=protected-access
     raise core._status_to_exception(e.code, e.message)  # pylint: disable=protected-access
   # pylint: enable=protected-access
 
-  tensors = [tensor._tensor_from_handle(x) for x in outh]  # pylint: disable=protected-access
-  if core.active_trace() is not None:
+  # Read the trace directly rather than through core.active_trace(): this runs
+  # for every op, and tracing is off in the common case.
+  trace = core._active_trace  # pylint: disable=protected-access
+  if trace is not None:
     trace_name = name if name else op_name
     for t in tensors:
       # pylint: disable=protected-access
-      core.active_trace().record_tensor(trace_name,
-                                        tape.tensor_id(t),
-                                        t._device_name(),
-                                        t.shape.num_elements())
+      trace.record_tensor(trace_name,
+                          tape.tensor_id(t),
+                          t._device_name(),
+                          t.shape.num_elements())
       # pylint: enable=protected-access
   return tensors
 
@@ -122,13 +144,26 @@ def make_bool(v, arg_name):
   return v
 
 
+# Cache of `make_type` results. Attr values naming a type are drawn from a
+# small set (DType objects, enum ints, numpy types, strings), so this stays
+# small.
+_TYPE_ENUM_CACHE = {}
+
+
 def make_type(v, arg_name):
   try:
-    v = dtypes.as_dtype(v).base_dtype
+    return _TYPE_ENUM_CACHE[v]
+  except (KeyError, TypeError):  # TypeError: `v` is unhashable.
+    pass
+  try:
+    i = dtypes.as_dtype(v).base_dtype.as_datatype_enum
   except TypeError:
     raise TypeError("Expected DataType for argument '%s' not %s." %
                     (arg_name, repr(v)))
-  i = v.as_datatype_enum
+  try:
+    _TYPE_ENUM_CACHE[v] = i
+  except TypeError:
+    pass
   return i
 
 
@@ -141,6 +176,11 @@ def make_shape(v, arg_name):
   # Returns:
   #   None if the rank is unknown, otherwise a list of ints (or Nones in the
   #   position where the dimension is unknown).
+  if isinstance(v, list) and all(
+      isinstance(d, six.integer_types) and not isinstance(d, bool) and d >= 0
+      for d in v):
+    # Fast path: already a fully-defined shape in the returned format.
+    return list(v)
   try:
     shape = tensor_shape.as_shape(v)
   except TypeError as e:
@@ -174,7 +214,7 @@ def args_to_matching_eager(l, default_dtype=None):
   # Is some input already a Tensor with a dtype?
   dtype = None
   for t in l:
-    if isinstance(ag_core.getval(t), tensor.Tensor):
+    if type(_getval(t)) is _Tensor:  # pylint: disable=unidiomatic-typecheck
       dtype = t.dtype
       break
 
@@ -198,8 +238,9 @@ def args_to_matching_eager(l, default_dtype=None):
 
 
 def convert_to_mixed_eager_tensors(values):
-  v = [t if isinstance(ag_core.getval(t), tensor.Tensor) else tensor.Tensor(t)
-       for t in values]
+  # pylint: disable=unidiomatic-typecheck
+  v = [t if type(_getval(t)) is _Tensor else _Tensor(t) for t in values]
+  # pylint: enable=unidiomatic-typecheck
   types = [t.dtype for t in v]
   return types, v
 
@@ -209,34 +250,27 @@ def args_to_mixed_eager_tensors(lists):
   assert len(lists) > 1
 
   # Generate an error if len(lists[i]) is not the same for all i.
-  lists_ret = []
   for l in lists[1:]:
     if len(l) != len(lists[0]):
       raise ValueError(
           "Expected list arguments to be the same length: %d != %d (%r vs. %r)"
           % (len(lists[0]), len(l), lists[0], l))
-    lists_ret.append([])
+  lists_ret = [[] for _ in lists]
 
   # Convert the first element of each list first, then the second element, etc.
   types = []
-  for i in range(len(lists[0])):
+  for column in zip(*lists):
+    # If any list has a Tensor, use that dtype. Otherwise convert the first
+    # one and use its dtype for the rest.
     dtype = None
-    # If any list has a Tensor, use that dtype
-    for l in lists:
-      if isinstance(ag_core.getval(l[i]), tensor.Tensor):
-        dtype = l[i].dtype
+    for t in column:
+      if type(_getval(t)) is _Tensor:  # pylint: disable=unidiomatic-typecheck
+        dtype = t.dtype
         break
-    if dtype is None:
-      # Convert the first one and use its dtype.
-      lists_ret[0].append(ops.convert_to_tensor(lists[0][i]))
-      dtype = lists_ret[0][i].dtype
-      for j in range(1, len(lists)):
-        lists_ret[j].append(
-            ops.convert_to_tensor(lists[j][i], dtype=dtype))
-    else:
-      # Convert everything to the found dtype.
-      for j in range(len(lists)):
-        lists_ret[j].append(
-            ops.convert_to_tensor(lists[j][i], dtype=dtype))
+    for l_ret, t in zip(lists_ret, column):
+      converted = ops.convert_to_tensor(t, dtype=dtype)
+      if dtype is None:
+        dtype = converted.dtype
+      l_ret.append(converted)
     types.append(dtype)
   return types, lists_ret
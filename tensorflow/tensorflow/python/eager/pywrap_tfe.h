@@ -31,7 +31,9 @@ typedef tensorflow::gtl::InlinedVector<TFE_TensorHandle*, 2>
 //                for automatic selection.
 // 'op_name': Name of the TensorFlow op to execute.
 // 'inputs': An array of TFE_TensorHandle*'s of size 'num_inputs'. These tensors
-//           will be provided as input to the operation.
+//           will be provided as input to the operation. The Python wrapper
+//           also accepts a sequence of eager Tensors here and extracts their
+//           handles.
 // 'attrs': A Python tuple alternating names and attr values.
 // 'outputs': A pointer to a TFE_OutputTensorHandles in which outputs will
 //            placed. On success, its elements will be filled in and the
@@ -60,6 +62,18 @@ TFE_TensorHandle* TFE_Py_NumpyToTensorHandle(PyObject* obj);
 // Py_None if registration succeeds, else throws a TypeError and returns NULL.
 PyObject* TFE_Py_RegisterExceptionClass(PyObject* e);
 
+// Registers 'f', a Python callable that wraps a TFE_TensorHandle into an eager
+// Tensor, or unregisters it if 'f' is None. While registered, the Python
+// wrapper of TFE_Py_Execute returns the wrapped Tensors instead of raw handles.
+// Must be called with the GIL held. Returns Py_None if registration succeeds,
+// else throws a TypeError and returns NULL.
+PyObject* TFE_Py_RegisterTensorFromHandleFunction(PyObject* f);
+
+// Returns a new reference to the callable registered via
+// TFE_Py_RegisterTensorFromHandleFunction, or NULL if there is none. Must be
+// called with the GIL held.
+PyObject* TFE_Py_TensorFromHandleFunction();
+
 // Returns 0 if 'status' is TF_OK. Otherwise, raises an exception (using the
 // class registered via TFE_Py_RegisterExceptionClass) and returns -1.
 int TFE_Py_MayBeRaiseException(TF_Status* status);
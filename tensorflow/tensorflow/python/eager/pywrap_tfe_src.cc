@@ -341,6 +341,10 @@ namespace {
 // Python subclass of Exception that is created on not ok Status.
 tensorflow::mutex exception_class_mutex(tensorflow::LINKER_INITIALIZED);
 PyObject* exception_class GUARDED_BY(exception_class_mutex) = nullptr;
+
+// Python callable used to wrap output handles of TFE_Py_Execute in Tensors.
+// Read on every op dispatch, so it is guarded by the GIL rather than a mutex.
+PyObject* tensor_from_handle = nullptr;
 }  // namespace
 
 TFE_TensorHandle* TFE_Py_NumpyToTensorHandle(PyObject* obj) {
@@ -381,6 +385,29 @@ PyObject* TFE_Py_RegisterExceptionClass(PyObject* e) {
   }
 }
 
+PyObject* TFE_Py_RegisterTensorFromHandleFunction(PyObject* f) {
+  if (f != Py_None && !PyCallable_Check(f)) {
+    PyErr_SetString(PyExc_TypeError,
+                    "TFE_Py_RegisterTensorFromHandleFunction: "
+                    "Registered object should be callable or None.");
+    return nullptr;
+  }
+  PyObject* old = tensor_from_handle;
+  if (f == Py_None) {
+    tensor_from_handle = nullptr;
+  } else {
+    Py_INCREF(f);
+    tensor_from_handle = f;
+  }
+  Py_XDECREF(old);
+  Py_RETURN_NONE;
+}
+
+PyObject* TFE_Py_TensorFromHandleFunction() {
+  Py_XINCREF(tensor_from_handle);
+  return tensor_from_handle;
+}
+
 int TFE_Py_MayBeRaiseException(TF_Status* status) {
   if (TF_GetCode(status) == TF_OK) return 0;
   tensorflow::mutex_lock l(exception_class_mutex);
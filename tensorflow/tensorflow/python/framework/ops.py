@@ -923,9 +923,11 @@ def _tensor_from_handle(handle):
   # pylint: disable=protected-access
   t = EagerTensor.__new__(EagerTensor)
   t._id = uid()
-  t._handle = handle
   t._dtype = dtypes.as_dtype(c_api.TFE_TensorHandleDataType(handle))
   t._handle_data = None
+  # Set last: once `t` owns the handle, its __del__ deletes it, which must not
+  # happen if construction fails and the caller releases the handle instead.
+  t._handle = handle
   return t
   # pylint: enable=protected-access
 
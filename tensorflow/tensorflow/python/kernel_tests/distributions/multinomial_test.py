@@ -338,6 +338,40 @@ class MultinomialTest(test.TestCase):
       self.assertAllClose(
           actual_covariance_, sample_covariance_, atol=0., rtol=0.10)
 
+  def testSampleCountsSumToTotalCount(self):
+    with self.test_session():
+      p = [[[0.1, 0.2, 0.7]], [[0.5, 0.5, 0.]]]
+      dist = multinomial.Multinomial(total_count=7., probs=p)
+      # Exercise the static-shape path of `_sample_n`.
+      self.assertTrue(dist.batch_shape.is_fully_defined())
+      self.assertTrue(dist.event_shape.is_fully_defined())
+      x = dist.sample(11, seed=0)
+      self.assertAllEqual([11, 2, 1, 3], x.get_shape())
+      x_ = x.eval()
+      self.assertAllEqual(7. * np.ones([11, 2, 1]), x_.sum(axis=-1))
+      self.assertTrue(np.all(x_ >= 0.))
+      self.assertAllEqual(np.round(x_), x_)
+      # Classes with zero probability are never drawn.
+      self.assertAllEqual(np.zeros([11, 1]), x_[:, 1, :, 2])
+
+  def testSampleFloat16LargeTotalCount(self):
+    with self.test_session():
+      dist = multinomial.Multinomial(
+          total_count=np.float16(5000.),
+          probs=np.array([1., 0.], dtype=np.float16))
+      x = dist.sample(2, seed=0)
+      self.assertEqual(dtypes.float16, x.dtype)
+      self.assertAllEqual([[5000., 0.], [5000., 0.]], x.eval())
+
+  def testSampleDynamicShapes(self):
+    with self.test_session():
+      p = array_ops.placeholder(dtypes.float32)
+      dist = multinomial.Multinomial(total_count=3., probs=p)
+      x_ = dist.sample(5, seed=0).eval(
+          feed_dict={p: [[0.2, 0.8], [0.6, 0.4], [1., 0.]]})
+      self.assertAllEqual([5, 3, 2], x_.shape)
+      self.assertAllEqual(3. * np.ones([5, 3]), x_.sum(axis=-1))
+
 
 if __name__ == "__main__":
   test.main()
@@ -369,6 +369,29 @@ class EmbedCheckIntegerCastingClosedTest(test.TestCase):
         x_checked.eval(feed_dict={x: np.array([1, -1], dtype=np.int32)})
 
 
+class EmbedCheckNonnegativeIntegerFormTest(test.TestCase):
+
+  def testCorrectlyAssertsNonnegative(self):
+    with self.test_session():
+      with self.assertRaisesOpError("must be non-negative"):
+        x = array_ops.placeholder(dtype=dtypes.int32)
+        x_checked = distribution_util.embed_check_nonnegative_integer_form(x)
+        x_checked.eval(feed_dict={x: np.array([1, -1], dtype=np.int32)})
+
+  def testCorrectlyAssertsIntegerForm(self):
+    with self.test_session():
+      with self.assertRaisesOpError("cannot contain fractional components"):
+        x = array_ops.placeholder(dtype=dtypes.float32)
+        x_checked = distribution_util.embed_check_nonnegative_integer_form(x)
+        x_checked.eval(feed_dict={x: np.array([1, 1.5], dtype=np.float32)})
+
+  def testUnsignedIsUnchecked(self):
+    with self.test_session():
+      x = array_ops.placeholder(dtype=dtypes.uint8)
+      x_checked = distribution_util.embed_check_nonnegative_integer_form(x)
+      self.assertIs(x, x_checked)
+
+
 class LogCombinationsTest(test.TestCase):
 
   def testLogCombinationsBinomial(self):
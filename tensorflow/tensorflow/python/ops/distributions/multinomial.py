@@ -18,12 +18,15 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import numpy as np
+
 from tensorflow.python.framework import dtypes
 from tensorflow.python.framework import ops
 from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import check_ops
 from tensorflow.python.ops import control_flow_ops
 from tensorflow.python.ops import math_ops
+from tensorflow.python.ops import nn_ops
 from tensorflow.python.ops import random_ops
 from tensorflow.python.ops.distributions import distribution
 from tensorflow.python.ops.distributions import util as distribution_util
@@ -183,12 +186,16 @@ class Multinomial(distribution.Distribution):
         self._total_count = (
             distribution_util.embed_check_nonnegative_integer_form(
                 self._total_count))
+      self._n_draws_int32 = math_ops.cast(self._total_count, dtypes.int32)
       self._logits, self._probs = distribution_util.get_logits_and_probs(
           logits=logits,
           probs=probs,
           multidimensional=True,
           validate_args=validate_args,
           name=name)
+      self._log_probs = nn_ops.log_softmax(self._logits)
+      self._broadcast_probs = self._probs * array_ops.ones_like(
+          self._total_count)[..., array_ops.newaxis]
       self._mean_val = self._total_count[..., array_ops.newaxis] * self._probs
     super(Multinomial, self).__init__(
         dtype=self._probs.dtype,
@@ -229,7 +236,7 @@ class Multinomial(distribution.Distribution):
     return self._mean_val.get_shape().with_rank_at_least(1)[-1:]
 
   def _sample_n(self, n, seed=None):
-    n_draws = math_ops.cast(self.total_count, dtype=dtypes.int32)
+    n_draws = self._n_draws_int32
     if self.total_count.get_shape().ndims is not None:
       if self.total_count.get_shape().ndims != 0:
         raise NotImplementedError(
@@ -239,18 +246,54 @@ class Multinomial(distribution.Distribution):
           n_draws, 0,
           message="Sample only supported for scalar number of draws.")
       n_draws = control_flow_ops.with_dependencies([is_scalar], n_draws)
-    k = self.event_shape_tensor()[0]
+    # Use static shapes when available so the shape arithmetic below is
+    # resolved at graph construction rather than computed by ops at runtime.
+    k = self.event_shape[0].value
+    if k is None:
+      k = self.event_shape_tensor()[0]
+    batch_shape = self.batch_shape
+    if batch_shape.is_fully_defined():
+      num_batch = batch_shape.num_elements()
+      final_shape = [n] + batch_shape.as_list() + [k]
+    else:
+      num_batch = math_ops.reduce_prod(self.batch_shape_tensor())
+      final_shape = array_ops.concat([[n], self.batch_shape_tensor(), [k]], 0)
     # Flatten batch dims so logits has shape [B, k],
     # where B = reduce_prod(self.batch_shape_tensor()).
-    x = random_ops.multinomial(
-        logits=array_ops.reshape(self.logits, [-1, k]),
-        num_samples=n * n_draws,
-        seed=seed)
-    x = array_ops.reshape(x, shape=[-1, n, n_draws])
-    x = math_ops.reduce_sum(array_ops.one_hot(x, depth=k),
-                            axis=-2)  # shape: [B, n, k]
-    x = array_ops.transpose(x, perm=[1, 0, 2])
-    final_shape = array_ops.concat([[n], self.batch_shape_tensor(), [k]], 0)
+    logits = array_ops.reshape(self.logits, [-1, k])
+    # Only the argmax of the perturbed logits matters, so the draws are done
+    # in float32 whatever `self.dtype` is: float64 would double the traffic on
+    # the largest tensor here, while float16 Gumbel noise is too coarse
+    # (`-log(-log(u))` saturates) and would bias the draws.
+    logits = math_ops.cast(logits, dtypes.float32)
+    # Draw categorical samples via the Gumbel-max trick, i.e.,
+    # `argmax(logits + g)` for `g ~ Gumbel(0, 1)`. The noise is laid out as
+    # `[n_draws, n, B, k]` so the draws come out already in sample-major order
+    # and no transpose is needed. As in `Exponential`, uniform variates are
+    # sampled from the open interval `(0, 1)` by using `np.finfo(dtype).tiny`
+    # as `minval`.
+    u = random_ops.random_uniform(
+        [n_draws, n, num_batch, k],
+        minval=np.finfo(logits.dtype.as_numpy_dtype).tiny,
+        maxval=1.,
+        seed=seed,
+        dtype=logits.dtype)
+    gumbel = -math_ops.log(-math_ops.log(u))
+    draws = math_ops.argmax(logits + gumbel, axis=-1,
+                            output_type=dtypes.int32)  # shape: [n_draws, n, B]
+    # Count the draws falling in each class by scattering them into a flat
+    # `[n * B * k]` buffer, rather than materializing and summing a
+    # `[n_draws, n, B, k]` one-hot tensor.
+    # `n` may be a numpy scalar and `num_batch` a Python int; keep the index
+    # arithmetic in int32 to match `draws`.
+    num_rows = ops.convert_to_tensor(n, dtype=dtypes.int32) * num_batch
+    offsets = array_ops.reshape(math_ops.range(num_rows) * k, [n, num_batch])
+    # Accumulate in float32 and cast once at the end; float16 cannot count past
+    # 2048 exactly.
+    x = math_ops.unsorted_segment_sum(
+        array_ops.ones_like(draws, dtype=dtypes.float32),
+        draws + offsets,
+        num_segments=num_rows * k)  # shape: [n * B * k]
     x = array_ops.reshape(x, final_shape)
     return math_ops.cast(x, self.dtype)
 
@@ -260,7 +303,7 @@ class Multinomial(distribution.Distribution):
 
   def _log_unnormalized_prob(self, counts):
     counts = self._maybe_assert_valid_sample(counts)
-    return math_ops.reduce_sum(counts * math_ops.log(self.probs), -1)
+    return math_ops.reduce_sum(counts * self._log_probs, -1)
 
   def _log_normalization(self, counts):
     counts = self._maybe_assert_valid_sample(counts)
@@ -270,17 +313,14 @@ class Multinomial(distribution.Distribution):
     return array_ops.identity(self._mean_val)
 
   def _covariance(self):
-    p = self.probs * array_ops.ones_like(
-        self.total_count)[..., array_ops.newaxis]
+    p = self._broadcast_probs
     return array_ops.matrix_set_diag(
-        -math_ops.matmul(self._mean_val[..., array_ops.newaxis],
-                         p[..., array_ops.newaxis, :]),  # outer product
+        -(self._mean_val[..., array_ops.newaxis] *
+          p[..., array_ops.newaxis, :]),  # outer product
         self._variance())
 
   def _variance(self):
-    p = self.probs * array_ops.ones_like(
-        self.total_count)[..., array_ops.newaxis]
-    return self._mean_val - self._mean_val * p
+    return self._mean_val * (1. - self._broadcast_probs)
 
   def _maybe_assert_valid_sample(self, counts):
     """Check counts for proper shape, values, then return tensor version."""
@@ -121,16 +121,20 @@ def embed_check_nonnegative_integer_form(
   """Assert x is a non-negative tensor, and optionally of integers."""
   with ops.name_scope(name, values=[x]):
     x = ops.convert_to_tensor(x, name="x")
-    assertions = [
-        check_ops.assert_non_negative(
-            x, message="'{}' must be non-negative.".format(x.op.name)),
-    ]
+    assertions = []
+    if not _is_known_unsigned_by_dtype(x.dtype):
+      assertions += [
+          check_ops.assert_non_negative(
+              x, message="'{}' must be non-negative.".format(x.op.name)),
+      ]
     if not x.dtype.is_integer:
       assertions += [
           assert_integer_form(
               x, message="'{}' cannot contain fractional components.".format(
                   x.op.name)),
       ]
+    if not assertions:
+      return x
     return control_flow_ops.with_dependencies(assertions, x)
 
 
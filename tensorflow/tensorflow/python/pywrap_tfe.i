@@ -16,6 +16,7 @@ limitations under the License.
 %ignore "";
 
 %rename("%s") TFE_Py_RegisterExceptionClass;
+%rename("%s") TFE_Py_RegisterTensorFromHandleFunction;
 %rename("%s") TFE_Py_NumpyToTensorHandle;
 %rename("%s") TFE_NewContext;
 %rename("%s") TFE_DeleteContext;
@@ -79,30 +80,59 @@ limitations under the License.
 
 %include "tensorflow/c/eager/c_api.h"
 
+// Accepts a sequence whose elements are either TFE_TensorHandle*'s or eager
+// Tensors (possibly wrapped in autograd nodes), so that callers do not need to
+// extract the handles in Python.
 %typemap(in) TFE_InputTensorHandles* inputs (TFE_InputTensorHandles temp) {
   $1 = &temp;
   if ($input != Py_None) {
-    if (!PyList_Check($input)) {
-      SWIG_exception_fail(SWIG_TypeError,
-                          "must provide a list of Tensors as inputs");
+    PyObject* seq = PySequence_Fast($input,
+                                    "must provide a list of Tensors as inputs");
+    if (!seq) {
+      SWIG_fail;
     }
-    Py_ssize_t len = PyList_Size($input);
+    Py_ssize_t len = PySequence_Fast_GET_SIZE(seq);
     $1->resize(len);
     for (Py_ssize_t i = 0; i < len; ++i) {
-      PyObject* elem = PyList_GetItem($input, i);
-      if (!elem) {
-        SWIG_fail;
-      }
+      PyObject* elem = PySequence_Fast_GET_ITEM(seq, i);
       void* thp = nullptr;
       int res = SWIG_ConvertPtr(elem, &thp,
                                 $descriptor(TFE_TensorHandle*), 0 | 0);
       if (!SWIG_IsOK(res)) {
+        // Equivalent of autograd's `getval(elem)._handle`: unwrap nodes
+        // through their `value` attribute until reaching the Tensor. The
+        // handle stays alive since `seq` holds a reference to `elem`.
+        PyObject* value = elem;
+        Py_INCREF(value);
+        while (!PyObject_HasAttrString(value, "_handle") &&
+               PyObject_HasAttrString(value, "value")) {
+          PyObject* inner = PyObject_GetAttrString(value, "value");
+          Py_DECREF(value);
+          if (!inner) {
+            Py_DECREF(seq);
+            SWIG_fail;
+          }
+          value = inner;
+        }
+        PyObject* handle = PyObject_GetAttrString(value, "_handle");
+        Py_DECREF(value);
+        if (handle) {
+          res = SWIG_ConvertPtr(handle, &thp,
+                                $descriptor(TFE_TensorHandle*), 0 | 0);
+          Py_DECREF(handle);
+        } else {
+          PyErr_Clear();
+        }
+      }
+      if (!SWIG_IsOK(res)) {
+        Py_DECREF(seq);
         SWIG_exception_fail(SWIG_ArgError(res),
                             "provided list of inputs contains objects other "
-                            "than 'TFE_TensorHandle*'");
+                            "than Tensors or 'TFE_TensorHandle*'");
       }
       (*$1)[i] = reinterpret_cast<TFE_TensorHandle*>(thp);
     }
+    Py_DECREF(seq);
   }
 }
 
@@ -126,17 +156,39 @@ limitations under the License.
  TF_DeleteStatus($1);
 }
 
+// Returns the outputs as a list of Tensors, built by the callable registered
+// via TFE_Py_RegisterTensorFromHandleFunction, or as raw handles if none is.
 %typemap(argout) (TFE_OutputTensorHandles* outputs, TF_Status* out_status) {
   if (TFE_Py_MayBeRaiseException($2)) {
     SWIG_fail;
   } else {
     int num_outputs = $1->size();
+    PyObject* tensor_from_handle = TFE_Py_TensorFromHandleFunction();
     $result = PyList_New(num_outputs);
     for (int i = 0; i < num_outputs; ++i) {
-      PyList_SetItem($result, i, SWIG_NewPointerObj(SWIG_as_voidptr($1->at(i)),
-                                                    $descriptor(TFE_TensorHandle*),
-                                                    0 | 0));
+      PyObject* output = SWIG_NewPointerObj(SWIG_as_voidptr($1->at(i)),
+                                            $descriptor(TFE_TensorHandle*),
+                                            0 | 0);
+      if (output != nullptr && tensor_from_handle != nullptr) {
+        PyObject* wrapped =
+            PyObject_CallFunctionObjArgs(tensor_from_handle, output, nullptr);
+        Py_DECREF(output);
+        output = wrapped;
+      }
+      if (output == nullptr) {
+        // Handles from `i` on have no Python owner (the pointer object is
+        // non-owning, and a Tensor only takes ownership once fully built), so
+        // release them here.
+        for (int j = i; j < num_outputs; ++j) {
+          TFE_DeleteTensorHandle($1->at(j));
+        }
+        Py_XDECREF(tensor_from_handle);
+        Py_DECREF($result);
+        SWIG_fail;
+      }
+      PyList_SET_ITEM($result, i, output);
     }
+    Py_XDECREF(tensor_from_handle);
   }
 }
 